@@ -0,0 +1,141 @@
+// assets/analytics.js - Clientside rendering for the consolidated analytics container
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    analytics: {
+        // One entry per stat output, in Output order: [metric key, kind,
+        // fallback, template]. Kinds: 'int' (thousands separators), a number
+        // (fixed decimals) or 'raw' (value as-is); '{}' in the template is
+        // replaced with the formatted value.
+        STAT_FIELDS: [
+            ['total_events', 'int', 0, '{}'],
+            ['date_range', 'raw', 'No data available', '{}'],
+            ['total_events', 'trend', 0, '{}'],
+            ['avg_events_per_day', 1, 0, 'Avg: {} events/day'],
+            ['unique_users', 'int', 0, 'Users: {}'],
+            ['avg_events_per_user', 1, 0, 'Avg: {} events/user'],
+            ['most_active_user', 'raw', 'N/A', 'Most active: {}'],
+            ['avg_users_per_device', 2, 0, 'Avg: {} users/device'],
+            ['num_devices', 'int', 0, 'Total: {} devices'],
+            ['entrance_devices_count', 'int', 0, 'Entrances: {}'],
+            ['high_security_devices', 'int', 0, 'High security: {}'],
+            ['device_utilization_rate', 1, 0, 'Utilization: {}%'],
+            ['peak_hour', 'raw', 'N/A', 'Peak hour: {}'],
+            ['peak_day', 'raw', 'N/A', 'Peak day: {}'],
+            ['busiest_floor', 'raw', 'N/A', 'Busiest floor: {}'],
+            ['weekend_vs_weekday_ratio', 'raw', 'N/A', 'Weekend vs Weekday: {}'],
+            ['security_score', 1, 0, 'Security score: {}%'],
+            ['anomaly_count', 'raw', 0, 'Anomalies: {} detected'],
+            ['compliance_score', 1, 0, 'Compliance: {}%'],
+            ['entry_exit_ratio', 'raw', 'N/A', 'Entry/Exit: {}'],
+            ['dominant_pattern', 'raw', 'Normal business hours', 'Pattern: {}'],
+            ['behavioral_pattern', 'raw', 'Standard access patterns', 'Behavior: {}'],
+            ['efficiency_score', 1, 0, 'Efficiency: {}%'],
+            ['overall_trend', 'raw', 'Stable', 'Trend: {}'],
+            ['unique_card_holders', 'int', 0, 'Card holders: {}'],
+            ['avg_session_duration', 1, 0, 'Avg session: {} min'],
+            ['peak_concurrent_users', 'int', 0, 'Peak concurrent: {}'],
+            ['security_events_count', 'int', 0, 'Security events: {}'],
+            ['maintenance_alerts', 'int', 0, 'Maintenance: {}'],
+            ['system_uptime', 1, 100, 'Uptime: {}%']
+        ],
+
+        formatStat: function(value, kind) {
+            if (kind === 'raw') {
+                return value;
+            }
+            const number = Number(value);
+            if (kind === 'trend') {
+                if (number > 1000) {
+                    return '📈 High Activity';
+                }
+                return number > 100 ? '📊 Normal Activity' : '📉 Low Activity';
+            }
+            if (!Number.isFinite(number)) {
+                return 'N/A';
+            }
+            return kind === 'int' ? Math.trunc(number).toLocaleString('en-US') : number.toFixed(kind);
+        },
+
+        // Format the enhanced metrics dict into the 30 stat strings of the
+        // consolidated container. Showing and hiding the container is left
+        // to the server callback that publishes the metrics.
+        renderStats: function(metrics, generateClicks) {
+            const self = window.dash_clientside.analytics;
+            if (!metrics || !generateClicks || Object.keys(metrics).length === 0) {
+                return Array(self.STAT_FIELDS.length).fill('N/A');
+            }
+
+            return self.STAT_FIELDS.map(([key, kind, fallback, template]) => {
+                const value = (metrics[key] === undefined || metrics[key] === null) ? fallback : metrics[key];
+                return template.replace('{}', () => self.formatStat(value, kind));
+            });
+        },
+
+        // Build the most-active-devices <tr> rows as Dash component JSON from
+        // the [name, events] pairs produced by the analysis.
+        renderDeviceTable: function(metrics, generateClicks) {
+            if (!metrics || !generateClicks || Object.keys(metrics).length === 0) {
+                return [];
+            }
+
+            const cell = (children, className) => ({
+                type: 'Td',
+                namespace: 'dash_html_components',
+                props: {children: children, className: 'device-table-cell ' + className}
+            });
+            const row = (cells) => ({
+                type: 'Tr',
+                namespace: 'dash_html_components',
+                props: {children: cells}
+            });
+
+            const devices = Array.isArray(metrics.most_active_devices) ? metrics.most_active_devices : [];
+            const rows = devices.slice(0, 5).map(([name, count]) => row([
+                cell(name, 'device-table-name'),
+                cell(Math.trunc(count).toLocaleString('en-US'), 'device-table-count')
+            ]));
+
+            if (rows.length === 0) {
+                rows.push(row([
+                    cell('No device data', 'device-table-empty'),
+                    cell('0', 'device-table-empty')
+                ]));
+            }
+            return rows;
+        },
+
+        // Debug panel lines (debug mode only): metrics count, first metric
+        // keys, processed row count and whether advanced metrics are present.
+        ADVANCED_KEYS: ['traffic_pattern', 'security_score', 'avg_events_per_user', 'most_active_user'],
+
+        renderDebugInfo: function(metrics, processed) {
+            const self = window.dash_clientside.analytics;
+            const isDict = (value) => !!value && typeof value === 'object' && !Array.isArray(value);
+
+            let metricsCount = '[ERROR] Metrics: No data or invalid format';
+            let metricsKeys = 'Keys: None';
+            let calculationStatus = 'Advanced metrics: Not calculated';
+            if (isDict(metrics) && Object.keys(metrics).length > 0) {
+                const keys = Object.keys(metrics);
+                metricsCount = '[OK] Metrics: ' + keys.length + ' items calculated';
+                metricsKeys = 'Keys: ' + keys.slice(0, 6).join(', ') + '...';
+                const hasAdvanced = self.ADVANCED_KEYS.some((key) => key in metrics);
+                calculationStatus = 'Advanced metrics: ' + (hasAdvanced ? 'YES' : 'MISSING');
+            }
+
+            // Mirrors has_dataframe / dataframe_row_count in utils/dataframe_store.py
+            let processedInfo = 'Processed: No data';
+            if (isDict(processed) && ('arrow' in processed || 'dataframe' in processed)) {
+                let rows = processed.row_count;
+                if (rows === undefined && Array.isArray(processed.dataframe)) {
+                    rows = processed.dataframe.length;
+                }
+                processedInfo = Number.isFinite(Number(rows)) && rows !== null
+                    ? 'Processed: ' + Math.trunc(Number(rows)) + ' rows available'
+                    : 'Processed: Invalid data format';
+            }
+
+            return [metricsCount, metricsKeys, processedInfo, calculationStatus];
+        }
+    }
+});
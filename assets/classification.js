@@ -0,0 +1,17 @@
+// assets/classification.js - Clientside UI wiring for the door classification step
+// (ui/components/classification_handlers.py)
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    classification: {
+        // Show the classification table only when manual mapping is chosen
+        toggleTable: function(manualMapChoice) {
+            return {display: manualMapChoice === 'yes' ? 'block' : 'none'};
+        },
+
+        // "1 floor" / "N floors"; the slider defaults to 4 floors
+        floorLabel: function(value) {
+            const floors = (value === undefined || value === null) ? 4 : Math.trunc(Number(value));
+            return floors === 1 ? '1 floor' : floors + ' floors';
+        }
+    }
+});
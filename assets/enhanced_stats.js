@@ -0,0 +1,92 @@
+// assets/enhanced_stats.js - Clientside rendering for the enhanced stats panels
+// (ui/components/enhanced_stats_handlers.py)
+
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    enhancedStats: {
+        // metrics[key], or fallback when the key is missing or null
+        value: function(metrics, key, fallback) {
+            const value = metrics[key];
+            return (value === undefined || value === null) ? fallback : value;
+        },
+
+        // Python's f"{value:,}"
+        grouped: function(value) {
+            const number = Number(value);
+            if (!Number.isFinite(number)) {
+                return 'Error';
+            }
+            return number.toLocaleString('en-US', {maximumFractionDigits: 6});
+        },
+
+        // Python's f"{value:.<digits>f}"
+        fixed: function(value, digits) {
+            const number = Number(value);
+            return Number.isFinite(number) ? number.toFixed(digits) : 'Error';
+        },
+
+        isEmpty: function(metrics) {
+            return !metrics || Object.keys(metrics).length === 0;
+        },
+
+        renderUserPatterns: function(metrics, nIntervals) {
+            const self = window.dash_clientside.enhancedStats;
+            if (self.isEmpty(metrics)) {
+                return ['No data', 'No data', 'No data'];
+            }
+            return [
+                'Most Active: ' + self.value(metrics, 'most_active_user', 'N/A'),
+                'Avg Events/User: ' + self.fixed(self.value(metrics, 'avg_events_per_user', 0), 2),
+                'Unique Users: ' + self.grouped(self.value(metrics, 'unique_users', 0))
+            ];
+        },
+
+        renderPeakActivity: function(metrics, nIntervals) {
+            const self = window.dash_clientside.enhancedStats;
+            if (self.isEmpty(metrics)) {
+                return Array(6).fill('No data');
+            }
+            // The events line reuses the peak day text when no count is provided
+            const peakDay = 'Peak Day: ' + self.value(metrics, 'peak_day', 'N/A');
+            return [
+                'Peak Hour: ' + self.value(metrics, 'peak_hour', 'N/A'),
+                peakDay,
+                peakDay,
+                'Busiest Floor: ' + self.value(metrics, 'busiest_floor', 'N/A'),
+                'Entry/Exit: ' + self.value(metrics, 'entry_exit_ratio', 'N/A'),
+                'Weekend vs Weekday: ' + self.value(metrics, 'weekend_vs_weekday', 'N/A')
+            ];
+        },
+
+        renderBasicStats: function(metrics) {
+            const self = window.dash_clientside.enhancedStats;
+            metrics = metrics || {};
+            const securityScore = self.value(metrics, 'security_score', null);
+            return [
+                self.grouped(self.value(metrics, 'total_events', 0)),
+                self.value(metrics, 'date_range', 'N/A'),
+                self.grouped(self.value(metrics, 'unique_users', 0)) + ' users',
+                'Avg: ' + self.fixed(self.value(metrics, 'avg_events_per_user', 0), 2) + ' events/user',
+                'Most Active: ' + self.value(metrics, 'most_active_user', 'N/A'),
+                self.grouped(self.value(metrics, 'total_devices_count', 0)) + ' devices',
+                'Peak: ' + self.value(metrics, 'peak_hour', 'N/A') + ':00',
+                'Busiest Day: ' + self.value(metrics, 'peak_day', 'N/A'),
+                'Activity: ' + self.value(metrics, 'activity_intensity', 'N/A'),
+                'Score: ' + (securityScore === null ? 'N/A' : securityScore),
+                'Sessions: ' + self.grouped(self.value(metrics, 'total_events', 0))
+            ];
+        },
+
+        renderAdditionalMetrics: function(metrics) {
+            const self = window.dash_clientside.enhancedStats;
+            metrics = metrics || {};
+            // Numbers are formatted; anything else is shown as-is, or N/A when empty
+            const show = (value, format) => (typeof value === 'number') ? format(value) : (value || 'N/A');
+            return [
+                show(metrics.avg_users_per_device, (v) => self.fixed(v, 2)),
+                show(metrics.entrance_devices_count, self.grouped),
+                show(metrics.high_security_devices, self.grouped),
+                show(metrics.efficiency_score, (v) => self.fixed(v, 2))
+            ];
+        }
+    }
+});
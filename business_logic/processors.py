@@ -7,6 +7,8 @@ import io
 import json
 import pandas as pd
 
+from utils.dataframe_store import encode_dataframe
+
 
 def handle_file_upload(contents: str | None, filename: str | None, column_mapping: dict | None) -> Tuple[dict | None, list | None, None, str]:
     """Process uploaded file and extract door list."""
@@ -25,7 +27,7 @@ def handle_file_upload(contents: str | None, filename: str | None, column_mappin
 
         processed_data = {
             "filename": filename,
-            "dataframe": df.to_dict("records"),
+            **encode_dataframe(df),
             "columns": df.columns.tolist(),
         }
 
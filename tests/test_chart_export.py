@@ -0,0 +1,53 @@
+import threading
+
+import pytest
+
+pytest.importorskip("dash")
+
+from utils import enhanced_analytics
+from utils.enhanced_analytics import collect_chart_png_export, submit_chart_png_export
+
+
+def _wait_until_done(job_id):
+    enhanced_analytics._PENDING_CHART_EXPORTS[job_id][1].exception(timeout=5)
+
+
+def test_png_export_reports_pending_then_done(monkeypatch):
+    release = threading.Event()
+
+    def render(fig, format):
+        release.wait(5)
+        return b"png"
+
+    monkeypatch.setattr(enhanced_analytics.pio, "to_image", render)
+    job_id = submit_chart_png_export({})
+
+    assert collect_chart_png_export(job_id) == ("pending", None)
+    release.set()
+    _wait_until_done(job_id)
+    assert collect_chart_png_export(job_id) == ("done", b"png")
+    # Collected jobs are forgotten
+    assert collect_chart_png_export(job_id) == ("unknown", None)
+
+
+def test_png_export_reports_failed_render(monkeypatch):
+    def render(fig, format):
+        raise RuntimeError("kaleido missing")
+
+    monkeypatch.setattr(enhanced_analytics.pio, "to_image", render)
+    job_id = submit_chart_png_export({})
+
+    _wait_until_done(job_id)
+    assert collect_chart_png_export(job_id) == ("failed", None)
+
+
+def test_png_export_unknown_and_expired_jobs(monkeypatch):
+    monkeypatch.setattr(enhanced_analytics.pio, "to_image", lambda fig, format: b"png")
+
+    assert collect_chart_png_export(None) == ("unknown", None)
+    assert collect_chart_png_export("no-such-job") == ("unknown", None)
+
+    stale_id = submit_chart_png_export({})
+    monkeypatch.setattr(enhanced_analytics, "_CHART_EXPORT_TTL_SECONDS", -1)
+    submit_chart_png_export({})
+    assert collect_chart_png_export(stale_id) == ("unknown", None)
@@ -0,0 +1,94 @@
+import pandas as pd
+import pytest
+
+from utils import dataframe_store
+from utils.dataframe_store import (
+    dataframe_cache_key,
+    dataframe_row_count,
+    decode_dataframe,
+    encode_dataframe,
+    has_dataframe,
+    load_events,
+    parse_timestamps,
+)
+
+
+def _sample_frame():
+    return pd.DataFrame(
+        {
+            "Timestamp (Event Time)": pd.to_datetime(
+                ["2024-01-01 08:00", "2024-01-01 09:30"]
+            ),
+            "DoorID (Device Name)": ["D1", "D2"],
+            "UserID (Person Identifier)": ["u1", "u2"],
+        }
+    )
+
+
+def test_round_trip_preserves_frame():
+    df = _sample_frame()
+    payload = {"filename": "events.csv", **encode_dataframe(df)}
+
+    assert has_dataframe(payload)
+    assert dataframe_row_count(payload) == 2
+    decoded = decode_dataframe(payload)
+    assert decoded["DoorID (Device Name)"].tolist() == ["D1", "D2"]
+
+
+def test_arrow_payload_keeps_datetime_dtype():
+    pytest.importorskip("pyarrow")
+    payload = encode_dataframe(_sample_frame())
+
+    assert dataframe_store.ARROW_KEY in payload
+    decoded = decode_dataframe(payload)
+    assert pd.api.types.is_datetime64_any_dtype(decoded["Timestamp (Event Time)"])
+
+
+def test_mixed_type_object_column_falls_back_to_records():
+    df = pd.DataFrame({"Door": [44, "Lobby"], "Count": [1, 2]})
+    payload = encode_dataframe(df)
+
+    assert dataframe_store.RECORDS_KEY in payload
+    assert decode_dataframe(payload)["Door"].tolist() == [44, "Lobby"]
+
+
+def test_legacy_records_payload_still_decodes():
+    payload = {"dataframe": [{"a": 1}, {"a": 2}]}
+
+    assert has_dataframe(payload)
+    assert decode_dataframe(payload)["a"].tolist() == [1, 2]
+    assert not has_dataframe({"filename": "x.csv"})
+    assert decode_dataframe(None).empty
+
+
+def test_parse_timestamps_handles_iso_and_other_formats():
+    parsed = parse_timestamps(pd.Series(["2024-01-01T08:00:00", "not a date"]))
+    assert parsed.iloc[0] == pd.Timestamp("2024-01-01 08:00")
+    assert pd.isna(parsed.iloc[1])
+
+    parsed = parse_timestamps(pd.Series(["01/02/2024 08:00", "01/03/2024 09:00"]))
+    assert parsed.tolist() == [pd.Timestamp("2024-01-02 08:00"), pd.Timestamp("2024-01-03 09:00")]
+
+    already = _sample_frame()["Timestamp (Event Time)"]
+    assert parse_timestamps(already) is already
+
+
+def test_load_events_parses_and_returns_independent_copies():
+    payload = {"dataframe": [{"Timestamp (Event Time)": "2024-01-01T08:00:00", "a": 1}]}
+
+    first = load_events(payload, "Timestamp (Event Time)")
+    assert first["Timestamp (Event Time)"].iloc[0] == pd.Timestamp("2024-01-01 08:00")
+
+    first.loc[0, "a"] = 99
+    second = load_events(payload, "Timestamp (Event Time)")
+    assert second["a"].iloc[0] == 1
+    assert load_events(None, "Timestamp (Event Time)").empty
+
+
+def test_cache_key_is_a_short_digest_of_the_frame():
+    records = {"dataframe": [{"a": 1}, {"a": 2}]}
+    key = dataframe_cache_key({"filename": "x.csv", **records})
+
+    assert len(key) == 32
+    assert key == dataframe_cache_key(records)
+    assert key != dataframe_cache_key({"dataframe": [{"a": 1}]})
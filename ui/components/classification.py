@@ -7,6 +7,7 @@ from dash import html, dcc, callback, Input, Output
 import dash_bootstrap_components as dbc
 from ui.themes.style_config import (
     COLORS,
+    BORDER_1PX,
     SPACING,
     BORDER_RADIUS,
     SHADOWS,
@@ -19,6 +20,19 @@ from ui.themes.style_config import (
     get_enhanced_button_style
 )
 
+# Slider marks are identical for every render (and every door row), so they
+# are built once here rather than in each layout call.
+FLOOR_SLIDER_MARKS = {i: str(i) for i in range(0, 101, 5)}
+SECURITY_SLIDER_MARKS = {
+    i: {
+        'label': str(i),
+        'style': {
+            'color': COLORS['text_secondary'],
+            'fontSize': TYPOGRAPHY['text_xs']
+        }
+    } for i in [0, 2, 4, 6, 8, 10]
+}
+
 
 class ClassificationComponent:
     """Centralized classification component with simplified toggle - COMPLETE"""
@@ -125,7 +139,7 @@ class ClassificationComponent:
                     'backgroundColor': COLORS['surface_elevated'],
                     'borderRadius': BORDER_RADIUS['xl'],
                     'padding': ENHANCED_SPACING['lg'],
-                    'border': f"1px solid {COLORS['border']}",
+                    'border': BORDER_1PX,
                     'boxShadow': SHADOWS['inner'],
                     'marginBottom': ENHANCED_SPACING['xl'],
                 },
@@ -137,7 +151,7 @@ class ClassificationComponent:
                         max=100,
                         step=5,
                         value=4,
-                        marks={i: str(i) for i in range(0, 101, 5)},
+                        marks=FLOOR_SLIDER_MARKS,
                         tooltip={"always_visible": False, "placement": "bottom"},
                         updatemode="drag",
                         className="enhanced-floor-slider"  # ADD enhanced class
@@ -304,7 +318,7 @@ class ClassificationComponent:
                     'padding': SPACING['sm'],
                     'backgroundColor': COLORS['background'],
                     'borderRadius': f"0 0 {BORDER_RADIUS['md']} {BORDER_RADIUS['md']}",
-                    'border': f"1px solid {COLORS['border']}",
+                    'border': BORDER_1PX,
                     'borderTop': 'none'
                 },
                 className='door-list-scrollable'
@@ -360,7 +374,7 @@ class ClassificationComponent:
                         'color': 'white' if pre_sel_door_type == 'entry_exit' else COLORS['text_secondary'],
                         'borderRadius': BORDER_RADIUS['full'],
                         'padding': f"{SPACING['xs']} {SPACING['sm']}",
-                        'border': f"1px solid {COLORS['border']}",
+                        'border': BORDER_1PX,
                         'cursor': 'pointer',
                         'fontSize': TYPOGRAPHY['text_sm'],
                         'transition': 'all 0.2s ease',
@@ -382,7 +396,7 @@ class ClassificationComponent:
                         'color': 'white' if pre_sel_door_type == 'stairway' else COLORS['text_secondary'],
                         'borderRadius': BORDER_RADIUS['full'],
                         'padding': f"{SPACING['xs']} {SPACING['sm']}",
-                        'border': f"1px solid {COLORS['border']}",
+                        'border': BORDER_1PX,
                         'cursor': 'pointer',
                         'fontSize': TYPOGRAPHY['text_sm'],
                         'transition': 'all 0.2s ease',
@@ -400,13 +414,7 @@ class ClassificationComponent:
                     max=10,
                     step=1,
                     value=pre_sel_security_val,
-                    marks={i: {
-                        'label': str(i),
-                        'style': {
-                            'color': COLORS['text_secondary'],
-                            'fontSize': TYPOGRAPHY['text_xs']
-                        }
-                    } for i in [0, 2, 4, 6, 8, 10]},
+                    marks=SECURITY_SLIDER_MARKS,
                     tooltip={"placement": "bottom", "always_visible": False},
                     className="security-range-slider"
                 )
@@ -418,7 +426,7 @@ class ClassificationComponent:
             'padding': SPACING['base'],
             'backgroundColor': COLORS['surface'],
             'borderRadius': BORDER_RADIUS['md'],
-            'border': f"1px solid {COLORS['border']}",
+            'border': BORDER_1PX,
             'marginBottom': SPACING['sm'],
             'boxShadow': SHADOWS['sm'],
             'transition': 'all 0.2s ease',
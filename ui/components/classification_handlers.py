@@ -7,7 +7,7 @@ import json
 import base64
 import io
 import pandas as pd
-from dash import Input, Output, State, html, callback, no_update
+from dash import ClientsideFunction, Input, Output, State, html, callback, no_update
 from dash.dependencies import ALL
 from dash.exceptions import PreventUpdate
 
@@ -76,34 +76,22 @@ class ClassificationHandlers:
                 return html.P("An error occurred during classification table generation.", style={'color': COLORS['critical']})
             
     def _register_classification_toggle_handler(self):
-        """Controls classification table visibility"""
-        @self.app.callback(
+        """Controls classification table visibility (assets/classification.js)"""
+        self.app.clientside_callback(
+            ClientsideFunction(namespace="classification", function_name="toggleTable"),
             Output('door-classification-table-container', 'style', allow_duplicate=True),
             Input('manual-map-toggle', 'value'),
             prevent_initial_call=True
         )
-        def toggle_classification_tools(manual_map_choice):
-            if manual_map_choice == 'yes':
-                return {'display': 'block'}
-            return {'display': 'none'}
 
     def _register_floor_slider_display_handler(self):
-        """Update floor display when slider value changes - FIXED with allow_duplicate"""
-        @self.app.callback(
+        """Update floor display when slider value changes (assets/classification.js)"""
+        self.app.clientside_callback(
+            ClientsideFunction(namespace="classification", function_name="floorLabel"),
             Output("floor-slider-value", "children", allow_duplicate=True),
             Input("floor-slider", "value"),
             prevent_initial_call='initial_duplicate'  # FIXED: Use 'initial_duplicate' with allow_duplicate
         )
-        def update_floor_display(value):
-            """Update the floor display text based on slider value"""
-            if value is None:
-                value = 4
-            
-            floors = int(value)
-            if floors == 1:
-                return "1 floor"
-            else:
-                return f"{floors} floors"
         
     def _register_door_table_generation_handler(self):
         """Generates door classification table when conditions are met - FIXED"""
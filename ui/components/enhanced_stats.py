@@ -818,6 +818,13 @@ class EnhancedStatsComponent:
                                 dcc.Download(id="download-excel"),
                                 dcc.Download(id="download-charts-png"),
                                 dcc.Download(id="download-json"),
+                                # Background PNG render job and its poller
+                                dcc.Store(id="png-export-job-store"),
+                                dcc.Interval(
+                                    id="png-export-poll-interval",
+                                    interval=500,
+                                    disabled=True,
+                                ),
                             ],
                             style=export_options_style,
                         ),
@@ -919,7 +926,7 @@ class EnhancedStatsComponent:
         if timestamp_col not in df.columns:
             return self._create_empty_chart("Timestamp data not available")
 
-        daily_data = df.groupby(df[timestamp_col].dt.date).size().reset_index()
+        daily_data = df.groupby(df[timestamp_col].dt.normalize()).size().reset_index()
         daily_data.columns = ["Date", "Events"]
 
         fig = go.Figure(
@@ -1003,7 +1010,8 @@ class EnhancedStatsComponent:
         if doorid_col not in df.columns:
             return self._create_empty_chart("Device data not available")
 
-        device_counts = df[doorid_col].value_counts().head(10)
+        # Only the top 10 are drawn, so select them instead of sorting every device
+        device_counts = df[doorid_col].value_counts(sort=False).nlargest(10)
 
         fig = go.Figure(
             data=[
@@ -1094,37 +1102,45 @@ class EnhancedStatsComponent:
         doorid_col = REQUIRED_INTERNAL_COLUMNS["DoorID"]
         userid_col = REQUIRED_INTERNAL_COLUMNS["UserID"]
 
+        # Datetime fields are extracted once and shared by the stats below
+        dates = None
         if timestamp_col in df.columns:
+            timestamps = df[timestamp_col]
+            hours = timestamps.dt.hour
+            dates = timestamps.dt.normalize()
+
             # Basic stats
             stats["total_events"] = len(df)
-            stats["date_range"] = self._get_date_range_string(df[timestamp_col])
-            stats["days_with_data"] = df[timestamp_col].dt.date.nunique()
+            stats["date_range"] = self._get_date_range_string(timestamps)
+            stats["days_with_data"] = dates.nunique()
 
             # Enhanced time-based analytics
-            stats["peak_hour"] = df[timestamp_col].dt.hour.mode()[0]
-            stats["peak_day"] = df[timestamp_col].dt.day_name().mode()[0]
+            stats["peak_hour"] = hours.mode()[0]
+            stats["peak_day"] = timestamps.dt.day_name().mode()[0]
             stats["events_per_day"] = round(
                 stats["total_events"] / max(stats["days_with_data"], 1), 2
             )
 
             # Activity patterns
-            hourly_activity = df.groupby(df[timestamp_col].dt.hour).size()
+            hourly_activity = df.groupby(hours).size()
             stats["activity_variance"] = hourly_activity.var()
             stats["peak_hour_events"] = hourly_activity.max()
 
         if doorid_col in df.columns:
             stats["num_devices"] = df[doorid_col].nunique()
             stats["devices_active_today"] = self._get_devices_active_today(
-                df, doorid_col, timestamp_col
+                df, doorid_col, dates
             )
 
         if userid_col in df.columns:
-            stats["unique_users"] = df[userid_col].nunique()
+            # One counting pass gives both the distinct users and the busiest one
+            user_counts = df[userid_col].value_counts()
+            stats["unique_users"] = len(user_counts)
             stats["avg_events_per_user"] = stats.get("total_events", 0) / max(
                 stats["unique_users"], 1
             )
             stats["most_active_user"] = (
-                df[userid_col].value_counts().index[0] if not df.empty else "N/A"
+                user_counts.index[0] if len(user_counts) > 0 else "N/A"
             )
 
         # Security analysis
@@ -1164,13 +1180,17 @@ class EnhancedStatsComponent:
             return f"{min_date.strftime('%d-%m-%Y')} - {max_date.strftime('%d-%m-%Y')}"
         return "N/A"
 
-    def _get_devices_active_today(self, df, doorid_col, timestamp_col):
-        """Gets count of devices active today"""
-        if timestamp_col not in df.columns:
+    def _get_devices_active_today(self, df, doorid_col, dates):
+        """Gets count of devices active today
+
+        ``dates`` is the event timestamps floored to midnight
+        (``.dt.normalize()``), or None when there is no timestamp column.
+        """
+        if dates is None:
             return 0
-        today = datetime.now().date()
-        today_data = df[df[timestamp_col].dt.date == today]
-        return today_data[doorid_col].nunique() if not today_data.empty else 0
+        today = pd.Timestamp(datetime.now().date(), tz=dates.dt.tz)
+        # Filter only the device column rather than copying the whole frame
+        return df[doorid_col][(dates == today).to_numpy()].nunique()
 
     def _normalize_security_column(self, series: pd.Series) -> pd.Series:
         """Translate numeric security levels to their string color values."""
@@ -3,12 +3,18 @@
 Enhanced Statistics handlers and callbacks
 """
 
-from dash import Input, Output, State, callback, no_update, html
+from dash import ClientsideFunction, Input, Output, State, callback, ctx, no_update, html
 import pandas as pd
+import base64
 import json
 from .enhanced_stats import create_enhanced_stats_component
 from ui.themes.style_config import COLORS, TYPOGRAPHY
 from config.settings import REQUIRED_INTERNAL_COLUMNS
+from utils.dataframe_store import load_events
+
+# Cell styles for the most active devices table rows
+DEVICE_NAME_CELL_STYLE = {"color": COLORS["text_primary"]}
+DEVICE_COUNT_CELL_STYLE = {"color": COLORS["text_secondary"]}
 
 
 class EnhancedStatsHandlers:
@@ -80,9 +86,10 @@ class EnhancedStatsHandlers:
                 return "Error", "Error", "--", {}, "Error", {}
 
     def _register_user_patterns_callback(self):
-        """Register User Patterns panel callback"""
+        """Register User Patterns panel callback (rendered in assets/enhanced_stats.js)"""
 
-        @self.app.callback(
+        self.app.clientside_callback(
+            ClientsideFunction(namespace="enhancedStats", function_name="renderUserPatterns"),
             [
                 Output("most-active-user", "children"),
                 Output("avg-user-activity", "children"),
@@ -94,19 +101,6 @@ class EnhancedStatsHandlers:
             ],
             prevent_initial_call=True,
         )
-        def update_user_patterns(enhanced_metrics, n_intervals):
-            """Update User Patterns panel"""
-            try:
-                if enhanced_metrics:
-                    return (
-                        f"Most Active: {enhanced_metrics.get('most_active_user', 'N/A')}",
-                        f"Avg Events/User: {enhanced_metrics.get('avg_events_per_user', 0):.2f}",
-                        f"Unique Users: {enhanced_metrics.get('unique_users', 0):,}",
-                    )
-                else:
-                    return "No data", "No data", "No data"
-            except Exception:
-                return "Error", "Error", "Error"
 
     def _register_device_analytics_callback(self):
         """Register Device Analytics panel callback"""
@@ -127,36 +121,17 @@ class EnhancedStatsHandlers:
             """Update Device Analytics panel"""
             try:
                 if enhanced_metrics:
-                    table_rows = []
-                    most_active_devices = enhanced_metrics.get(
-                        "most_active_devices", []
-                    )
-                    for device_info in most_active_devices[:5]:
-                        if isinstance(device_info, dict):
-                            device_name = device_info.get("device", "Unknown")
-                            event_count = device_info.get("events", 0)
-                        else:
-                            device_name = (
-                                str(device_info[0])
-                                if len(device_info) > 0
-                                else "Unknown"
-                            )
-                            event_count = device_info[1] if len(device_info) > 1 else 0
-
-                        table_rows.append(
-                            html.Tr(
-                                [
-                                    html.Td(
-                                        device_name,
-                                        style={"color": COLORS["text_primary"]},
-                                    ),
-                                    html.Td(
-                                        f"{event_count:,}",
-                                        style={"color": COLORS["text_secondary"]},
-                                    ),
-                                ]
-                            )
+                    table_rows = [
+                        html.Tr(
+                            [
+                                html.Td(device_name, style=DEVICE_NAME_CELL_STYLE),
+                                html.Td(f"{event_count:,}", style=DEVICE_COUNT_CELL_STYLE),
+                            ]
                         )
+                        for device_name, event_count in enhanced_metrics.get(
+                            "most_active_devices", []
+                        )[:5]
+                    ]
 
                     return (
                         f"Total Devices: {enhanced_metrics.get('total_devices_count', 0):,}",
@@ -169,9 +144,10 @@ class EnhancedStatsHandlers:
                 return "Error", "Error", []
 
     def _register_peak_activity_callback(self):
-        """Register Peak Activity panel callback"""
+        """Register Peak Activity panel callback (rendered in assets/enhanced_stats.js)"""
 
-        @self.app.callback(
+        self.app.clientside_callback(
+            ClientsideFunction(namespace="enhancedStats", function_name="renderPeakActivity"),
             [
                 Output("peak-hour-display", "children", allow_duplicate=True),
                 Output("peak-day-display", "children", allow_duplicate=True),
@@ -186,40 +162,6 @@ class EnhancedStatsHandlers:
             ],
             prevent_initial_call=True,
         )
-        def update_peak_activity(enhanced_metrics, n_intervals):
-            """Update Peak Activity panel"""
-            try:
-                if enhanced_metrics:
-                    peak_day = f"Peak Day: {enhanced_metrics.get('peak_day', 'N/A')}"
-                    # Reuse peak_day information for the events text if a
-                    # specific count is not provided
-                    peak_activity = peak_day
-                    return (
-                        f"Peak Hour: {enhanced_metrics.get('peak_hour', 'N/A')}",
-                        peak_day,
-                        peak_activity,
-                        f"Busiest Floor: {enhanced_metrics.get('busiest_floor', 'N/A')}",
-                        f"Entry/Exit: {enhanced_metrics.get('entry_exit_ratio', 'N/A')}",
-                        f"Weekend vs Weekday: {enhanced_metrics.get('weekend_vs_weekday', 'N/A')}",
-                    )
-                else:
-                    return (
-                        "No data",
-                        "No data",
-                        "No data",
-                        "No data",
-                        "No data",
-                        "No data",
-                    )
-            except Exception:
-                return (
-                    "Error",
-                    "Error",
-                    "Error",
-                    "Error",
-                    "Error",
-                    "Error",
-                )
 
     def _register_security_overview_callback(self):
         """Register Security Overview panel callback"""
@@ -285,7 +227,6 @@ class EnhancedStatsHandlers:
                 Input("chart-devices-btn", "n_clicks"),
             ],
             [
-                State("enhanced-stats-data-store", "data"),
                 State("processed-data-store", "data"),
                 State("device-attrs-store", "data"),
             ],
@@ -296,29 +237,16 @@ class EnhancedStatsHandlers:
             daily_clicks,
             security_clicks,
             devices_clicks,
-            stats_data,
             processed_data,
             device_attrs,
         ):
             """Update main analytics chart based on button clicks"""
-            from dash import ctx
-            import pandas as pd
-
             if not ctx.triggered:
                 return self.component._create_empty_chart("Select a chart type")
 
             button_id = ctx.triggered[0]["prop_id"].split(".")[0]
 
-            df = pd.DataFrame()
-            if (
-                processed_data
-                and isinstance(processed_data, dict)
-                and "dataframe" in processed_data
-            ):
-                df = pd.DataFrame(processed_data["dataframe"])
-                ts_col = REQUIRED_INTERNAL_COLUMNS["Timestamp"]
-                if ts_col in df.columns:
-                    df[ts_col] = pd.to_datetime(df[ts_col], errors="coerce")
+            df = load_events(processed_data, REQUIRED_INTERNAL_COLUMNS["Timestamp"])
 
             device_df = pd.DataFrame()
             if device_attrs and isinstance(device_attrs, dict):
@@ -347,7 +275,8 @@ class EnhancedStatsHandlers:
             [
                 Output("download-pdf", "data"),
                 Output("download-excel", "data"),
-                Output("download-charts-png", "data"),
+                Output("png-export-job-store", "data"),
+                Output("png-export-poll-interval", "disabled"),
                 Output("download-json", "data"),
                 Output("export-status", "children", allow_duplicate=True),
             ],
@@ -365,13 +294,13 @@ class EnhancedStatsHandlers:
             pdf_clicks, excel_clicks, charts_clicks, json_clicks, stats_data, chart_fig
         ):
             """Handle export button clicks and provide downloadable files"""
-            from dash import ctx
-            from utils.enhanced_analytics import create_enhanced_export_manager
-            import plotly.io as pio
-            import base64
+            from utils.enhanced_analytics import (
+                create_enhanced_export_manager,
+                submit_chart_png_export,
+            )
 
             if not ctx.triggered:
-                return [no_update] * 5
+                return [no_update] * 6
 
             button_id = ctx.triggered[0]["prop_id"].split(".")[0]
             manager = create_enhanced_export_manager()
@@ -387,6 +316,7 @@ class EnhancedStatsHandlers:
                         no_update,
                         no_update,
                         no_update,
+                        no_update,
                         "📄 PDF report generated successfully!",
                     )
             elif button_id == "export-excel-btn":
@@ -400,21 +330,22 @@ class EnhancedStatsHandlers:
                         dict(content=content, filename=report["filename"]),
                         no_update,
                         no_update,
+                        no_update,
                         "📊 Excel data exported successfully!",
                     )
             elif button_id == "export-charts-btn":
                 if chart_fig:
-                    try:
-                        img_bytes = pio.to_image(chart_fig, format="png")
-                        return (
-                            no_update,
-                            no_update,
-                            dict(content=img_bytes, filename="chart.png"),
-                            no_update,
-                            "📈 Charts exported as PNG!",
-                        )
-                    except Exception:
-                        pass
+                    # Rendering happens on the export pool; the poller below
+                    # delivers the file once it is ready.
+                    job_id = submit_chart_png_export(chart_fig)
+                    return (
+                        no_update,
+                        no_update,
+                        job_id,
+                        False,
+                        no_update,
+                        "📈 Rendering charts as PNG...",
+                    )
             elif button_id == "export-json-btn":
                 report = manager.export_comprehensive_report(
                     stats_data or {}, format="JSON"
@@ -425,16 +356,45 @@ class EnhancedStatsHandlers:
                         no_update,
                         no_update,
                         no_update,
+                        no_update,
                         dict(content=content, filename=report["filename"]),
                         "💾 Raw data exported as JSON!",
                     )
 
-            return [no_update, no_update, no_update, no_update, "Export completed"]
+            return [no_update] * 5 + ["Export completed"]
+
+        @self.app.callback(
+            [
+                Output("download-charts-png", "data"),
+                Output("png-export-poll-interval", "disabled", allow_duplicate=True),
+                Output("export-status", "children", allow_duplicate=True),
+            ],
+            Input("png-export-poll-interval", "n_intervals"),
+            State("png-export-job-store", "data"),
+            prevent_initial_call=True,
+        )
+        def poll_png_export(n_intervals, job_id):
+            """Deliver a finished background PNG export"""
+            from utils.enhanced_analytics import collect_chart_png_export
+
+            status, img_bytes = collect_chart_png_export(job_id)
+            if status == "pending":
+                return no_update, no_update, no_update
+            if status == "unknown":
+                return no_update, True, "⚠️ Chart export expired, please retry"
+            if status == "failed":
+                return no_update, True, "⚠️ Chart export failed"
+            return (
+                dict(content=img_bytes, filename="chart.png"),
+                True,
+                "📈 Charts exported as PNG!",
+            )
 
     def _register_basic_stats_callback(self):
-        """Update legacy stats elements"""
+        """Update legacy stats elements (rendered in assets/enhanced_stats.js)"""
 
-        @self.app.callback(
+        self.app.clientside_callback(
+            ClientsideFunction(namespace="enhancedStats", function_name="renderBasicStats"),
             [
                 Output("total-access-events-H1", "children", allow_duplicate=True),
                 Output("event-date-range-P", "children", allow_duplicate=True),
@@ -451,42 +411,12 @@ class EnhancedStatsHandlers:
             Input("enhanced-stats-data-store", "data"),
             prevent_initial_call=True,
         )
-        def _update_basic(enhanced_metrics):
-            metrics = enhanced_metrics or {}
-
-            total_events = f"{metrics.get('total_events', 0):,}"
-            date_range = metrics.get("date_range", "N/A")
-            unique_users = f"{metrics.get('unique_users', 0):,} users"
-            avg_events = f"Avg: {metrics.get('avg_events_per_user', 0):.2f} events/user"
-
-            most_active = f"Most Active: {metrics.get('most_active_user', 'N/A')}"
-            total_devices = f"{metrics.get('total_devices_count', 0):,} devices"
-            peak_hour = f"Peak: {metrics.get('peak_hour', 'N/A')}:00"
-            busiest_floor = f"Busiest Day: {metrics.get('peak_day', 'N/A')}"
-            activity_intensity = metrics.get("activity_intensity", "N/A")
-            traffic_pattern = f"Activity: {activity_intensity}"
-            sec = metrics.get("security_score")
-            security_score = f"Score: {sec}" if sec is not None else "Score: N/A"
-            anomaly_insight = f"Sessions: {metrics.get('total_events', 0):,}"
-
-            return (
-                total_events,
-                date_range,
-                unique_users,
-                avg_events,
-                most_active,
-                total_devices,
-                peak_hour,
-                busiest_floor,
-                traffic_pattern,
-                security_score,
-                anomaly_insight,
-            )
 
     def _register_additional_metrics_callback(self):
-        """Update extended metric elements"""
+        """Update extended metric elements (rendered in assets/enhanced_stats.js)"""
 
-        @self.app.callback(
+        self.app.clientside_callback(
+            ClientsideFunction(namespace="enhancedStats", function_name="renderAdditionalMetrics"),
             [
                 Output("stats-devices-per-user", "children"),
                 Output("entrance-devices-count", "children"),
@@ -496,39 +426,6 @@ class EnhancedStatsHandlers:
             Input("enhanced-stats-data-store", "data"),
             prevent_initial_call=True,
         )
-        def _update_additional(metrics):
-            metrics = metrics or {}
-
-            devices_per_user = metrics.get("avg_users_per_device")
-            entrance_count = metrics.get("entrance_devices_count")
-            high_sec = metrics.get("high_security_devices")
-            efficiency = metrics.get("efficiency_score")
-
-            if isinstance(devices_per_user, (int, float)):
-                devices_per_user = f"{devices_per_user:.2f}"
-            else:
-                devices_per_user = devices_per_user or "N/A"
-
-            if isinstance(entrance_count, (int, float)):
-                entrance_count = f"{entrance_count:,}"
-            else:
-                entrance_count = entrance_count or "N/A"
-
-            if isinstance(high_sec, (int, float)):
-                high_sec = f"{high_sec:,}"
-            else:
-                high_sec = high_sec or "N/A"
-
-            if isinstance(efficiency, (int, float)):
-                efficiency = f"{efficiency:.2f}"
-            else:
-                efficiency = efficiency or "N/A"
-            return (
-                devices_per_user,
-                entrance_count,
-                high_sec,
-                efficiency,
-            )
 
 
 def create_enhanced_stats_handlers(app):
@@ -3,10 +3,10 @@
 
 from dash import Input, Output, State, callback, no_update
 from dash.exceptions import PreventUpdate
-import pandas as pd
 import json
 
 from ui.components.graph import create_graph_component
+from utils.dataframe_store import load_events
 
 
 class GraphHandlers:
@@ -89,10 +89,6 @@ class GraphHandlers:
                 raise PreventUpdate
 
             try:
-                df = pd.DataFrame(processed_data.get("dataframe", []))
-                if df.empty:
-                    return [], {"display": "none"}, "No data to generate graph"
-
                 door_col = "DoorID (Device Name)"
                 ts_col = "Timestamp (Event Time)"
                 if isinstance(mappings, dict):
@@ -104,8 +100,11 @@ class GraphHandlers:
                         elif internal == "Timestamp":
                             ts_col = csv_col
 
+                df = load_events(processed_data, ts_col)
+                if df.empty:
+                    return [], {"display": "none"}, "No data to generate graph"
+
                 if ts_col in df.columns:
-                    df[ts_col] = pd.to_datetime(df[ts_col], errors="coerce")
                     df.sort_values(ts_col, inplace=True)
 
                 doors = df[door_col].astype(str).tolist() if door_col in df.columns else []
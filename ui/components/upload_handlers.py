@@ -17,6 +17,7 @@ from config.settings import REQUIRED_INTERNAL_COLUMNS
 from utils.logging_config import get_logger
 from utils.error_handler import ValidationError, DataProcessingError
 from utils.helpers import process_large_csv
+from utils.dataframe_store import encode_dataframe
 from utils.secure_validator import validate_upload_security
 logger = get_logger(__name__)                 
 
@@ -266,7 +267,7 @@ class UploadHandlers:
 
             processed_data = {
                 'filename': filename,
-                'dataframe': df.to_dict('records'),
+                **encode_dataframe(df),
                 'columns': df.columns.tolist(),
                 'row_count': len(df),
                 'upload_timestamp': pd.Timestamp.now().isoformat(),
@@ -14,6 +14,7 @@ import json
 from ui.core.interfaces import StatefulComponent, ComponentConfig
 from ui.core.dependency_injection import inject, DataService, EventBus
 from ui.core.config_manager import get_component_config
+from utils.dataframe_store import encode_dataframe
 
 class ModularUploadComponent(StatefulComponent):
     """Modular upload component with clean separation of concerns"""
@@ -145,7 +146,8 @@ class ModularUploadComponent(StatefulComponent):
              Output(self.content_id, 'children')],
             [Input(self.upload_id, 'contents')],
             [State(self.upload_id, 'filename'),
-             State(self.upload_id, 'last_modified')]
+             State(self.upload_id, 'last_modified')],
+            prevent_initial_call=True
         )
         def handle_upload(contents, filename, last_modified):
             if contents is None:
@@ -296,7 +298,7 @@ class ModularUploadComponent(StatefulComponent):
             # Return processed data in consistent format
             return {
                 'filename': filename,
-                'dataframe': df.to_dict('records'),
+                **encode_dataframe(df),
                 'columns': df.columns.tolist(),
                 'row_count': len(df),
                 'column_count': len(df.columns),
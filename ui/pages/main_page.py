@@ -6,7 +6,10 @@ All callbacks are handled by unified handler in app.py
 """
 
 from dash import html, dcc
-from ui.components.classification import create_classification_component
+from ui.components.classification import (
+    FLOOR_SLIDER_MARKS,
+    create_classification_component,
+)
 
 from ui.themes.style_config import COLORS, TYPOGRAPHY, SPACING, BORDER_RADIUS
 from ui.themes.helpers import (
@@ -246,7 +249,7 @@ def create_facility_setup():
                 max=20,
                 step=1,
                 value=4,
-                marks={i: str(i) for i in range(0, 101, 5)},
+                marks=FLOOR_SLIDER_MARKS,
                 tooltip={"always_visible": False, "placement": "bottom"}
             ),
             html.Div(
@@ -29,6 +29,9 @@ COLORS = {
     'text_on_accent': '#FFFFFF',    # Text on accent backgrounds
 }
 
+# Standard 1px border in the theme border colour
+BORDER_1PX = f"1px solid {COLORS['border']}"
+
 # Animation durations
 ANIMATIONS = {
     'fast': '0.15s',
@@ -146,14 +149,14 @@ ENHANCED_SHADOWS = {
 COMPONENT_STYLES = {
     'card': {
         'background-color': COLORS['surface'],
-        'border': f"1px solid {COLORS['border']}",
+        'border': BORDER_1PX,
         'border-radius': BORDER_RADIUS['xl'],
         'box-shadow': SHADOWS['lg'],
         'padding': SPACING['xl']
     },
     'card_elevated': {
         'background-color': COLORS['surface_elevated'],
-        'border': f"1px solid {COLORS['border']}",
+        'border': BORDER_1PX,
         'border-radius': BORDER_RADIUS['xl'],
         'box-shadow': SHADOWS['xl'],
         'padding': SPACING['xl']
@@ -172,7 +175,7 @@ COMPONENT_STYLES = {
     'button_secondary': {
         'background-color': 'transparent',
         'color': COLORS['text_secondary'],
-        'border': f"1px solid {COLORS['border']}",
+        'border': BORDER_1PX,
         'padding': f"{SPACING['sm']} {SPACING['lg']}",
         'border-radius': BORDER_RADIUS['lg'],
         'font-weight': TYPOGRAPHY['font_medium'],
@@ -192,7 +195,7 @@ COMPONENT_STYLES = {
     },
     'input': {
         'background-color': COLORS['surface'],
-        'border': f"1px solid {COLORS['border']}",
+        'border': BORDER_1PX,
         'border-radius': BORDER_RADIUS['md'],
         'padding': SPACING['sm'],
         'color': COLORS['text_primary'],
@@ -266,7 +269,7 @@ UI_COMPONENTS = {
         'card_style': {
             'backgroundColor': COLORS['surface'],
             'borderRadius': BORDER_RADIUS['md'],
-            'border': f"1px solid {COLORS['border']}",
+            'border': BORDER_1PX,
             'boxShadow': SHADOWS['sm'],
             'transition': 'all 0.2s ease'
         },
@@ -274,7 +277,7 @@ UI_COMPONENTS = {
             'backgroundColor': COLORS['surface'],
             'color': COLORS['text_secondary'],
             'borderRadius': BORDER_RADIUS['full'],
-            'border': f"1px solid {COLORS['border']}",
+            'border': BORDER_1PX,
             'cursor': 'pointer',
             'transition': 'all 0.2s ease'
         },
@@ -317,7 +320,7 @@ LAYOUT_CONFIG = {
 # Style for the debug information panel used in the application
 DEBUG_PANEL_STYLE = {
     "backgroundColor": COLORS["surface"],
-    "border": f"1px solid {COLORS['border']}",
+    "border": BORDER_1PX,
     "borderRadius": "8px",
     "padding": "15px",
     "marginTop": "20px",
@@ -374,7 +377,7 @@ UPLOAD_STYLES = {
         'margin': f"{SPACING['lg']} auto",
         'width': '85%',
         'maxWidth': '1000px',
-        'border': f"1px solid {COLORS['border']}"
+        'border': BORDER_1PX
     },
     'generate_button': {
         'marginTop': SPACING['lg']
@@ -391,7 +394,7 @@ MAPPING_STYLES = {
         'backgroundColor': COLORS['surface'],
         'borderRadius': BORDER_RADIUS['md'],
         'boxShadow': SHADOWS['sm'],
-        'border': f"1px solid {COLORS['border']}"
+        'border': BORDER_1PX
     },
     'confirm_button': {
         'marginTop': '15px',
@@ -431,7 +434,7 @@ CLASSIFICATION_STYLES = {
         'backgroundColor': COLORS['surface'],
         'borderRadius': BORDER_RADIUS['lg'],
         'marginBottom': '20px',
-        'border': f"1px solid {COLORS['border']}",
+        'border': BORDER_1PX,
         'maxWidth': '550px',
         'margin': '0 auto 20px auto'
     },
@@ -439,7 +442,7 @@ CLASSIFICATION_STYLES = {
         'padding': '20px',
         'backgroundColor': COLORS['surface'],
         'borderRadius': BORDER_RADIUS['lg'],
-        'border': f"1px solid {COLORS['border']}",
+        'border': BORDER_1PX,
         'maxWidth': '900px',
         'margin': '0 auto'
     }
@@ -472,7 +475,7 @@ ENHANCED_COMPONENT_STYLES = {
     # Enhanced Card Variants
     'card_premium': {
         'background-color': COLORS['surface_elevated'],
-        'border': f"1px solid {COLORS['border']}",
+        'border': BORDER_1PX,
         'border-radius': BORDER_RADIUS['2xl'],
         'box-shadow': ENHANCED_SHADOWS['2xl'],
         'padding': ENHANCED_SPACING['2xl'],
@@ -482,7 +485,7 @@ ENHANCED_COMPONENT_STYLES = {
     
     'card_interactive': {
         'background-color': COLORS['surface'],
-        'border': f"1px solid {COLORS['border']}",
+        'border': BORDER_1PX,
         'border-radius': BORDER_RADIUS['xl'],
         'box-shadow': SHADOWS['lg'],
         'padding': SPACING['xl'],
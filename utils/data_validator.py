@@ -12,6 +12,7 @@ from utils.logging_config import get_logger
 
 from utils.error_handler import ValidationError, DataProcessingError
 from utils.csv_validator import CSVValidator
+from utils.dataframe_store import parse_timestamps
 from ui.components.mapping import MappingValidator
 from config.settings import REQUIRED_INTERNAL_COLUMNS, FILE_LIMITS
 
@@ -128,7 +129,7 @@ class EnhancedDataValidator:
         if timestamp_col in df.columns:
             # Check for invalid timestamps
             try:
-                pd.to_datetime(df[timestamp_col], errors='coerce')
+                parse_timestamps(df[timestamp_col])
                 null_timestamps = df[timestamp_col].isna().sum()
                 if null_timestamps > 0:
                     warnings.append(f"{null_timestamps} records have invalid timestamps")
@@ -0,0 +1,164 @@
+"""
+Encoding of DataFrames held in ``dcc.Store`` payloads.
+
+The uploaded event log is stored as base64 Arrow IPC bytes under the
+``"arrow"`` key when pyarrow is available, so readers get the frame back
+with its dtypes intact instead of rebuilding it from a list of records.
+Without pyarrow the legacy ``"dataframe"`` records layout is used.
+
+Callbacks that read the same store payload share one decoded frame through
+:func:`load_events`.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import threading
+from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Hashable, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover - optional dependency
+    pa = None
+
+ARROW_KEY = "arrow"
+RECORDS_KEY = "dataframe"
+
+
+def encode_dataframe(df: pd.DataFrame) -> Dict[str, Any]:
+    """Return the store fields holding ``df``.
+
+    Frames Arrow cannot hold as-is (object columns mixing ints and strings,
+    non-string column names) use the records layout instead.
+    """
+    if pa is None or not all(isinstance(col, str) for col in df.columns):
+        return {RECORDS_KEY: df.to_dict("records")}
+
+    try:
+        table = pa.Table.from_pandas(df, preserve_index=False)
+    except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+        return {RECORDS_KEY: df.to_dict("records")}
+    sink = io.BytesIO()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return {ARROW_KEY: base64.b64encode(sink.getvalue()).decode("ascii")}
+
+
+def has_dataframe(payload: Optional[Dict[str, Any]]) -> bool:
+    """Whether a store payload carries an encoded DataFrame."""
+    return isinstance(payload, dict) and (ARROW_KEY in payload or RECORDS_KEY in payload)
+
+
+def decode_dataframe(payload: Optional[Dict[str, Any]]) -> pd.DataFrame:
+    """Rebuild the DataFrame written by :func:`encode_dataframe`."""
+    if not isinstance(payload, dict):
+        return pd.DataFrame()
+
+    encoded = payload.get(ARROW_KEY)
+    if encoded is not None:
+        if pa is None:
+            raise ImportError("pyarrow is required to read Arrow store payloads")
+        reader = pa.ipc.open_stream(io.BytesIO(base64.b64decode(encoded)))
+        return reader.read_pandas()
+
+    return pd.DataFrame(payload.get(RECORDS_KEY, []))
+
+
+def parse_timestamps(values: pd.Series) -> pd.Series:
+    """Return ``values`` as ``datetime64``, coercing unparseable entries to NaT.
+
+    Columns that already have a datetime dtype (the Arrow path) are returned
+    as-is. ISO 8601 strings go through pandas' vectorized parser; other
+    formats fall back to the inferred parse.
+    """
+    if values.dtype.kind == "M":
+        return values
+    try:
+        return pd.to_datetime(values, format="ISO8601", cache=True)
+    except (ValueError, TypeError):
+        return pd.to_datetime(values, errors="coerce", cache=True)
+
+
+def dataframe_row_count(payload: Optional[Dict[str, Any]]) -> int:
+    """Number of rows in a store payload without decoding it where possible."""
+    if not isinstance(payload, dict):
+        return 0
+    if "row_count" in payload:
+        return int(payload["row_count"])
+    if RECORDS_KEY in payload:
+        return len(payload[RECORDS_KEY])
+    return len(decode_dataframe(payload))
+
+
+def dataframe_cache_key(payload: Dict[str, Any]) -> str:
+    """Short digest of the encoded frame in a payload, for use as a cache key."""
+    if ARROW_KEY in payload:
+        encoded = payload[ARROW_KEY].encode("ascii")
+    else:
+        encoded = json.dumps(
+            payload.get(RECORDS_KEY, []), sort_keys=True, default=str
+        ).encode("utf-8")
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def cached_on_key(maxsize: int) -> Callable:
+    """LRU cache for ``func(key, *args)`` that looks results up by ``key`` alone.
+
+    The remaining arguments (e.g. the store payload a digest was taken from)
+    are only used to build a missing entry and are not kept by the cache.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        lock = threading.Lock()
+
+        @wraps(func)
+        def wrapper(key: Hashable, *args: Any) -> Any:
+            with lock:
+                if key in entries:
+                    entries.move_to_end(key)
+                    return entries[key]
+            value = func(key, *args)
+            with lock:
+                entries[key] = value
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+            return value
+
+        return wrapper
+
+    return decorator
+
+
+def load_events(
+    payload: Optional[Dict[str, Any]],
+    timestamp_col: str,
+    frame_key: Optional[str] = None,
+) -> pd.DataFrame:
+    """Decode a store payload with ``timestamp_col`` parsed, reusing earlier work.
+
+    The decoded frame is cached on :func:`dataframe_cache_key`, so callbacks
+    fired by the same store update decode and parse it once. Callers that
+    already hold the key can pass it as ``frame_key``. Each caller gets its
+    own copy and is free to modify it.
+    """
+    if not has_dataframe(payload):
+        return pd.DataFrame()
+    if frame_key is None:
+        frame_key = dataframe_cache_key(payload)
+    return _events_for_key((frame_key, timestamp_col), payload).copy()
+
+
+@cached_on_key(maxsize=4)
+def _events_for_key(key: Any, payload: Dict[str, Any]) -> pd.DataFrame:
+    """Shared frame behind :func:`load_events`; must not be modified."""
+    timestamp_col = key[1]
+    df = decode_dataframe(payload)
+    if timestamp_col in df.columns:
+        df[timestamp_col] = parse_timestamps(df[timestamp_col])
+    return df
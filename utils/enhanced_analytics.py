@@ -9,10 +9,15 @@ import numpy as np
 import json
 import base64
 import io
+import re
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Dict, List, Tuple, Any, Optional, Union
 import plotly.graph_objects as go
 import plotly.express as px
+import plotly.io as pio
 from plotly.subplots import make_subplots
 
 from config.settings import REQUIRED_INTERNAL_COLUMNS
@@ -21,6 +26,18 @@ from utils.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# PNG rendering goes through Kaleido (a headless browser) and can take hundreds
+# of milliseconds, so it runs on a small pool instead of the request thread.
+# Jobs live in this process only, so the export poll must reach the worker
+# that queued it (single-process server or sticky sessions). Jobs nobody
+# collects, e.g. after the tab is closed, are dropped after the TTL.
+_CHART_EXPORT_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="chart-export")
+_CHART_EXPORT_TTL_SECONDS = 10 * 60
+_PENDING_CHART_EXPORTS: Dict[str, Tuple[float, Future]] = {}
+
+# Event types counted as refused access
+_DENIED_EVENT_PATTERN = re.compile("DENIED|FAILED", re.IGNORECASE)
+
 
 class EnhancedDataProcessor:
     """Enhanced data processing for comprehensive analytics"""
@@ -53,7 +70,7 @@ class EnhancedDataProcessor:
         patterns['busiest_day_count'] = daily_counts.max()
         
         # Weekly patterns
-        weekly_counts = df.groupby(df[self.timestamp_col].dt.date).size()
+        weekly_counts = df.groupby(df[self.timestamp_col].dt.normalize()).size()
         patterns['daily_average'] = weekly_counts.mean()
         patterns['daily_variance'] = weekly_counts.var()
         patterns['trend_slope'] = self._calculate_trend_slope(weekly_counts)
@@ -112,9 +129,10 @@ class EnhancedDataProcessor:
         # Device performance metrics
         if self.timestamp_col in df.columns:
             # Devices active today
-            today = datetime.now().date()
-            today_data = df[df[self.timestamp_col].dt.date == today]
-            analytics['devices_active_today'] = today_data[self.doorid_col].nunique() if not today_data.empty else 0
+            dates = df[self.timestamp_col].dt.normalize()
+            today = pd.Timestamp(datetime.now().date(), tz=dates.dt.tz)
+            today_mask = (dates == today).to_numpy()
+            analytics['devices_active_today'] = df[self.doorid_col][today_mask].nunique()
             
             # Device activity trends
             device_trends = self._calculate_device_trends(df)
@@ -268,7 +286,7 @@ class EnhancedDataProcessor:
             return trends
         
         device_daily_counts = recent_data.groupby([
-            recent_data[self.timestamp_col].dt.date,
+            recent_data[self.timestamp_col].dt.normalize(),
             self.doorid_col
         ]).size().unstack(fill_value=0)
         
@@ -340,11 +358,17 @@ class EnhancedDataProcessor:
         
         # Calculate denied access rate if available
         if self.eventtype_col in df.columns:
-            denied_events = df[df[self.eventtype_col].str.contains('DENIED|FAILED', case=False, na=False)]
+            # Event types are a handful of distinct values, so match the
+            # pattern once per value rather than once per row
+            type_counts = df[self.eventtype_col].value_counts()
+            denied_count = sum(
+                count for event_type, count in type_counts.items()
+                if isinstance(event_type, str) and _DENIED_EVENT_PATTERN.search(event_type)
+            )
             total_events = len(df)
             
             if total_events > 0:
-                denial_rate = (len(denied_events) / total_events) * 100
+                denial_rate = (denied_count / total_events) * 100
                 effectiveness['denial_rate'] = round(denial_rate, 2)
                 effectiveness['access_success_rate'] = round(100 - denial_rate, 2)
         
@@ -772,23 +796,12 @@ class EnhancedAnalyticsProcessor:
         device_attrs: Optional[pd.DataFrame] = None,
     ) -> Dict[str, Any]:
         """Process uploaded data with debug output."""
-        print(f"🔍 ANALYTICS PROCESSOR - DataFrame columns: {list(df.columns)}")
-        print(
-            f"🔍 Looking for timestamp column: '{REQUIRED_INTERNAL_COLUMNS['Timestamp']}' - Found: "
-            f"{REQUIRED_INTERNAL_COLUMNS['Timestamp'] in df.columns}"
-        )
-        print(
-            f"🔍 Looking for user column: '{REQUIRED_INTERNAL_COLUMNS['UserID']}' - Found: "
-            f"{REQUIRED_INTERNAL_COLUMNS['UserID'] in df.columns}"
-        )
-        print(
-            f"🔍 Looking for device column: '{REQUIRED_INTERNAL_COLUMNS['DoorID']}' - Found: "
-            f"{REQUIRED_INTERNAL_COLUMNS['DoorID'] in df.columns}"
-        )
-        print(
-            f"🔍 Looking for access column: '{REQUIRED_INTERNAL_COLUMNS['EventType']}' - Found: "
-            f"{REQUIRED_INTERNAL_COLUMNS['EventType'] in df.columns}"
-        )
+        logger.debug("Analytics processor columns: %s", list(df.columns))
+        for key in ('Timestamp', 'UserID', 'DoorID', 'EventType'):
+            logger.debug(
+                "Looking for %s column '%s' - found: %s",
+                key, REQUIRED_INTERNAL_COLUMNS[key], REQUIRED_INTERNAL_COLUMNS[key] in df.columns,
+            )
 
         return self._processor.process_security_analytics(device_attrs, df)
 
@@ -805,6 +818,45 @@ class EnhancedAnalyticsProcessor:
         return self._processor.process_security_analytics(device_attrs, df)
 
 
+# Background chart export
+def submit_chart_png_export(chart_fig: Any) -> str:
+    """Queue a PNG render of ``chart_fig`` and return the job id to poll"""
+    now = time.monotonic()
+    for stale_id, (submitted_at, future) in list(_PENDING_CHART_EXPORTS.items()):
+        if now - submitted_at > _CHART_EXPORT_TTL_SECONDS:
+            future.cancel()
+            _PENDING_CHART_EXPORTS.pop(stale_id, None)
+
+    job_id = uuid.uuid4().hex
+    _PENDING_CHART_EXPORTS[job_id] = (
+        now,
+        _CHART_EXPORT_EXECUTOR.submit(pio.to_image, chart_fig, format='png'),
+    )
+    return job_id
+
+
+def collect_chart_png_export(job_id: Optional[str]) -> Tuple[str, Optional[bytes]]:
+    """Return ``(status, png_bytes)`` for a queued export.
+
+    ``status`` is ``"pending"`` while the render runs, ``"done"`` with the
+    PNG bytes, ``"failed"`` when the render raised, or ``"unknown"`` when
+    this process holds no such job (expired, restarted or another worker).
+    """
+    job = _PENDING_CHART_EXPORTS.get(job_id) if job_id else None
+    if job is None:
+        return "unknown", None
+    future = job[1]
+    if not future.done():
+        return "pending", None
+
+    _PENDING_CHART_EXPORTS.pop(job_id, None)
+    try:
+        return "done", future.result()
+    except Exception as e:
+        logger.error(f"PNG export error: {e}")
+        return "failed", None
+
+
 # Factory functions
 def create_enhanced_data_processor():
     """Create enhanced data processor instance"""
@@ -872,4 +924,6 @@ __all__ = [
     "create_enhanced_export_manager",
     "create_enhanced_anomaly_detector",
     "create_enhanced_analytics_processor",
+    "submit_chart_png_export",
+    "collect_chart_png_export",
 ]
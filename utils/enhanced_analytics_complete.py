@@ -3,12 +3,22 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from collections import Counter
+from typing import Any, Dict, Optional, Tuple, Union
 import pandas as pd
 import numpy as np
 from datetime import datetime
 
 from config.settings import REQUIRED_INTERNAL_COLUMNS
+from utils.dataframe_store import parse_timestamps
+
+_WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+
+
+def _weekday_hour_counts(weekdays: np.ndarray, hours: np.ndarray) -> np.ndarray:
+    """Return a 7x24 matrix of event counts per (weekday, hour)."""
+    codes = weekdays.astype(np.intp) * 24 + hours.astype(np.intp)
+    return np.bincount(codes, minlength=7 * 24).reshape(7, 24)
 
 
 class EnhancedDataProcessorComplete:
@@ -20,9 +30,15 @@ class EnhancedDataProcessorComplete:
         self.doorid_col = REQUIRED_INTERNAL_COLUMNS['DoorID']
 
     def process_complete_analytics(
-        self, df: pd.DataFrame, device_attrs: Optional[pd.DataFrame] = None
+        self,
+        df: pd.DataFrame,
+        device_attrs: Optional[Union[pd.DataFrame, Dict[str, Dict[str, Any]]]] = None,
     ) -> Dict[str, Any]:
-        """Return all computed metrics used across the UI."""
+        """Return all computed metrics used across the UI.
+
+        ``device_attrs`` may be a DataFrame or the ``{door: attributes}``
+        classification mapping as stored in the UI.
+        """
         if df is None or df.empty:
             return {}
 
@@ -30,44 +46,65 @@ class EnhancedDataProcessorComplete:
 
         df = df.copy()
         if self.timestamp_col in df.columns:
-            df[self.timestamp_col] = pd.to_datetime(df[self.timestamp_col], errors="coerce")
+            df[self.timestamp_col] = parse_timestamps(df[self.timestamp_col])
             df.dropna(subset=[self.timestamp_col], inplace=True)
 
+        # Factorize the identifier columns once; unique counts then come
+        # straight from the category index instead of a hash pass per call.
+        for col in (self.userid_col, self.doorid_col):
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+
         # Basic counts
         metrics['total_events'] = len(df)
-        metrics['unique_users'] = df[self.userid_col].nunique() if self.userid_col in df.columns else 0
+        metrics['unique_users'] = df[self.userid_col].cat.categories.size if self.userid_col in df.columns else 0
         metrics['avg_events_per_user'] = (
             metrics['total_events'] / metrics['unique_users'] if metrics['unique_users'] else 0
         )
-        metrics['total_devices_count'] = df[self.doorid_col].nunique() if self.doorid_col in df.columns else 0
-
-        # Hourly distribution
+        metrics['total_devices_count'] = df[self.doorid_col].cat.categories.size if self.doorid_col in df.columns else 0
+
+        # Top devices as (name, events) pairs, largest first
+        if self.doorid_col in df.columns:
+            top_devices = df[self.doorid_col].value_counts(sort=False).nlargest(5)
+            top_devices = top_devices[top_devices > 0]
+            metrics['most_active_devices'] = list(zip(top_devices.index.tolist(), top_devices.tolist()))
+        else:
+            metrics['most_active_devices'] = []
+
+        # Hourly / daily distributions and the heatmap all come from a single
+        # count over (weekday, hour); the 1-D distributions are its marginals
+        # rather than separate passes over the events.
         if self.timestamp_col in df.columns:
-            hour_counts = df[self.timestamp_col].dt.hour.value_counts().sort_index()
+            ts = df[self.timestamp_col]
+            heatmap = pd.DataFrame(
+                _weekday_hour_counts(
+                    ts.dt.dayofweek.to_numpy(), ts.dt.hour.to_numpy()
+                )
+            )
+            hour_counts = heatmap.sum(axis=0)
+            hour_counts = hour_counts[hour_counts > 0]
             metrics['hourly_distribution'] = hour_counts.to_dict()
             if not hour_counts.empty:
                 metrics['peak_hour'] = int(hour_counts.idxmax())
-            day_counts = df[self.timestamp_col].dt.day_name().value_counts()
+            day_counts = heatmap.sum(axis=1)
+            day_counts.index = [_WEEKDAYS[d] for d in day_counts.index]
+            day_counts = day_counts[day_counts > 0].sort_values(ascending=False, kind='stable')
             metrics['daily_distribution'] = day_counts.to_dict()
             if not day_counts.empty:
                 metrics['busiest_day'] = day_counts.idxmax()
-            # Heatmap matrix
-            df['Hour'] = df[self.timestamp_col].dt.hour
-            df['DayOfWeek'] = df[self.timestamp_col].dt.day_name()
-            heatmap = df.groupby(['DayOfWeek', 'Hour']).size().unstack(fill_value=0)
             metrics['heatmap_values'] = heatmap.values.tolist()
             metrics['heatmap_hours'] = list(range(24))
-            metrics['heatmap_days'] = [
-                'Monday','Tuesday','Wednesday','Thursday','Friday','Saturday','Sunday'
-            ]
-            heatmap = heatmap.reindex(metrics['heatmap_days'])
-            metrics['heatmap_values'] = heatmap.values.tolist()
+            metrics['heatmap_days'] = list(_WEEKDAYS)
 
         # Floor distribution
         floor_distribution = {}
         entrance_devices = 0
         high_security_devices = 0
-        if device_attrs is not None and not device_attrs.empty:
+        if isinstance(device_attrs, dict):
+            floor_distribution, entrance_devices, high_security_devices = (
+                self._summarize_device_attrs(device_attrs)
+            )
+        elif device_attrs is not None and not device_attrs.empty:
             if 'floor' in device_attrs.columns:
                 floor_distribution = device_attrs['floor'].value_counts().to_dict()
             if 'entrance' in device_attrs.columns:
@@ -89,10 +126,30 @@ class EnhancedDataProcessorComplete:
 
         return metrics
 
+    @staticmethod
+    def _summarize_device_attrs(device_attrs: Dict[str, Dict[str, Any]]) -> Tuple[Dict[Any, int], int, int]:
+        """Floor counts, entrance count and high-security count from a
+        ``{door: attributes}`` classification mapping."""
+        floors: Counter = Counter()
+        entrance_devices = 0
+        high_security_devices = 0
+        for attrs in device_attrs.values():
+            if not isinstance(attrs, dict):
+                continue
+            floor = attrs.get('floor')
+            if floor is not None:
+                floors[floor] += 1
+            if attrs.get('entrance'):
+                entrance_devices += 1
+            level = attrs.get('SecurityLevel')
+            if isinstance(level, (int, float)) and level >= 3:
+                high_security_devices += 1
+        return dict(floors.most_common()), entrance_devices, high_security_devices
+
     def _calculate_trend_slope(self, series: pd.Series) -> float:
         if series.empty:
             return 0.0
-        daily_counts = series.dt.date.value_counts().sort_index()
+        daily_counts = series.dt.normalize().value_counts().sort_index()
         if len(daily_counts) < 2:
             return 0.0
         x = np.arange(len(daily_counts))